@@ -1,6 +1,7 @@
+import filecmp
 import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Set, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 from rich.console import Console
@@ -23,8 +24,10 @@ class ProjectGenerator:
         self.project_name = project_name
         self.orm = orm
         self.output_path = output_path
+        self.app_dir = output_path / "app"
         self.with_rbac = with_rbac
         self.with_celery = with_celery
+        self._created_dirs: Set[Path] = set()
 
         self.env = Environment(
             loader=FileSystemLoader(str(TEMPLATES_DIR)),
@@ -49,7 +52,7 @@ class ProjectGenerator:
         ) as progress:
             task = progress.add_task("Generating project...", total=None)
 
-            self.output_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.output_path)
 
             progress.update(task, description="Generating base files...")
             self._generate_base_files()
@@ -81,16 +84,14 @@ class ProjectGenerator:
             ("base/pre-commit-config.yaml", ".pre-commit-config.yaml"),
             ("base/Dockerfile", "Dockerfile"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
         # Optional: Celery worker entry point
         if self.with_celery:
             self._copy_file("base/celery_worker.py", "celery_worker.py")
 
     def _generate_app_structure(self) -> None:
-        app_dir = self.output_path / "app"
-        app_dir.mkdir(exist_ok=True)
+        self._ensure_dir(self.app_dir)
 
         self._copy_file("app/__init__.py", "app/__init__.py")
 
@@ -114,8 +115,8 @@ class ProjectGenerator:
             self._generate_tasks()
 
     def _generate_core(self) -> None:
-        core_dir = self.output_path / "app" / "core"
-        core_dir.mkdir(exist_ok=True)
+        core_dir = self.app_dir / "core"
+        self._ensure_dir(core_dir)
 
         # Templates (need rendering)
         templates = [
@@ -133,8 +134,7 @@ class ProjectGenerator:
             ("app/core/singleton.py", "app/core/singleton.py"),
             ("app/core/redis.py", "app/core/redis.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
         # ORM-specific database file
         if self.orm == "tortoise":
@@ -147,8 +147,8 @@ class ProjectGenerator:
             self._copy_file("app/core/rbac.py", "app/core/rbac.py")
 
     def _generate_api(self) -> None:
-        api_v1_dir = self.output_path / "app" / "api" / "v1" / "endpoints"
-        api_v1_dir.mkdir(parents=True, exist_ok=True)
+        api_v1_dir = self.app_dir / "api" / "v1" / "endpoints"
+        self._ensure_dir(api_v1_dir)
 
         static_files = [
             ("app/api/__init__.py", "app/api/__init__.py"),
@@ -159,12 +159,11 @@ class ProjectGenerator:
             ("app/api/v1/endpoints/auth.py", "app/api/v1/endpoints/auth.py"),
             ("app/api/v1/endpoints/users.py", "app/api/v1/endpoints/users.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_models(self) -> None:
-        models_dir = self.output_path / "app" / "models"
-        models_dir.mkdir(exist_ok=True)
+        models_dir = self.app_dir / "models"
+        self._ensure_dir(models_dir)
 
         self._copy_file("app/models/__init__.py", "app/models/__init__.py")
 
@@ -176,8 +175,8 @@ class ProjectGenerator:
             self._copy_file("app/models/user_sqlalchemy.py", "app/models/user.py")
 
     def _generate_schemas(self) -> None:
-        schemas_dir = self.output_path / "app" / "schemas"
-        schemas_dir.mkdir(exist_ok=True)
+        schemas_dir = self.app_dir / "schemas"
+        self._ensure_dir(schemas_dir)
 
         static_files = [
             ("app/schemas/__init__.py", "app/schemas/__init__.py"),
@@ -185,12 +184,11 @@ class ProjectGenerator:
             ("app/schemas/auth.py", "app/schemas/auth.py"),
             ("app/schemas/user.py", "app/schemas/user.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_repositories(self) -> None:
-        repo_dir = self.output_path / "app" / "repositories"
-        repo_dir.mkdir(exist_ok=True)
+        repo_dir = self.app_dir / "repositories"
+        self._ensure_dir(repo_dir)
 
         self._copy_file("app/repositories/__init__.py", "app/repositories/__init__.py")
 
@@ -202,8 +200,8 @@ class ProjectGenerator:
             self._copy_file("app/repositories/user_sqlalchemy.py", "app/repositories/user.py")
 
     def _generate_services(self) -> None:
-        services_dir = self.output_path / "app" / "services"
-        services_dir.mkdir(exist_ok=True)
+        services_dir = self.app_dir / "services"
+        self._ensure_dir(services_dir)
 
         if self.orm == "tortoise":
             self._copy_file("app/services/__init___tortoise.py", "app/services/__init__.py")
@@ -215,8 +213,8 @@ class ProjectGenerator:
             self._copy_file("app/services/user_sqlalchemy.py", "app/services/user.py")
 
     def _generate_middleware(self) -> None:
-        middleware_dir = self.output_path / "app" / "middleware"
-        middleware_dir.mkdir(exist_ok=True)
+        middleware_dir = self.app_dir / "middleware"
+        self._ensure_dir(middleware_dir)
 
         # ORM-specific __init__.py
         if self.orm == "tortoise":
@@ -233,24 +231,22 @@ class ProjectGenerator:
             ("app/middleware/sign.py", "app/middleware/sign.py"),
             ("app/middleware/tracing.py", "app/middleware/tracing.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_exceptions(self) -> None:
-        exceptions_dir = self.output_path / "app" / "exceptions"
-        exceptions_dir.mkdir(exist_ok=True)
+        exceptions_dir = self.app_dir / "exceptions"
+        self._ensure_dir(exceptions_dir)
 
         static_files = [
             ("app/exceptions/__init__.py", "app/exceptions/__init__.py"),
             ("app/exceptions/base.py", "app/exceptions/base.py"),
             ("app/exceptions/handlers.py", "app/exceptions/handlers.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_utils(self) -> None:
-        utils_dir = self.output_path / "app" / "utils"
-        utils_dir.mkdir(exist_ok=True)
+        utils_dir = self.app_dir / "utils"
+        self._ensure_dir(utils_dir)
 
         # Template (need rendering)
         self._render_template("app/utils/sort_helper.py.jinja2", "app/utils/sort_helper.py")
@@ -263,12 +259,11 @@ class ProjectGenerator:
             ("app/utils/auth.py", "app/utils/auth.py"),
             ("app/utils/cache.py", "app/utils/cache.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_tasks(self) -> None:
-        tasks_dir = self.output_path / "app" / "tasks" / "jobs"
-        tasks_dir.mkdir(parents=True, exist_ok=True)
+        tasks_dir = self.app_dir / "tasks" / "jobs"
+        self._ensure_dir(tasks_dir)
 
         static_files = [
             ("app/tasks/__init__.py", "app/tasks/__init__.py"),
@@ -276,15 +271,14 @@ class ProjectGenerator:
             ("app/tasks/jobs/__init__.py", "app/tasks/jobs/__init__.py"),
             ("app/tasks/jobs/example.py", "app/tasks/jobs/example.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
 
     def _generate_tests(self) -> None:
         tests_dir = self.output_path / "tests"
-        tests_dir.mkdir(exist_ok=True)
+        self._ensure_dir(tests_dir)
 
         api_tests_dir = tests_dir / "api"
-        api_tests_dir.mkdir(exist_ok=True)
+        self._ensure_dir(api_tests_dir)
 
         static_files = [
             ("tests/__init__.py", "tests/__init__.py"),
@@ -292,8 +286,19 @@ class ProjectGenerator:
             ("tests/api/__init__.py", "tests/api/__init__.py"),
             ("tests/api/test_health.py", "tests/api/test_health.py"),
         ]
-        for src_path, output_name in static_files:
-            self._copy_file(src_path, output_name)
+        self._copy_files(static_files)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once; repeat calls for the same path skip the syscall."""
+        if path in self._created_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(path)
+        # parents=True created the ancestors too
+        for parent in path.parents:
+            if parent in self._created_dirs:
+                break
+            self._created_dirs.add(parent)
 
     def _render_template(self, template_path: str, output_name: str) -> None:
         """Render a Jinja2 template with context variables."""
@@ -301,12 +306,22 @@ class ProjectGenerator:
         content = template.render(**self.context)
 
         output_file = self.output_path / output_name
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_file.parent)
+        # Re-running with --force leaves unchanged files untouched
+        if output_file.exists() and output_file.read_bytes() == content.encode("utf-8"):
+            return
         output_file.write_text(content, encoding="utf-8")
 
     def _copy_file(self, src_path: str, output_name: str) -> None:
         """Copy a static file without rendering."""
         src_file = TEMPLATES_DIR / src_path
         output_file = self.output_path / output_name
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_file, output_file)
+        self._ensure_dir(output_file.parent)
+        if output_file.exists() and filecmp.cmp(src_file, output_file, shallow=False):
+            return
+        shutil.copyfile(src_file, output_file)
+
+    def _copy_files(self, files: List[Tuple[str, str]]) -> None:
+        """Copy a batch of static files without rendering."""
+        for src_path, output_name in files:
+            self._copy_file(src_path, output_name)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from urllib.parse import urlparse
 
 import pymysql
@@ -72,7 +72,7 @@ class MySQLIntrospector:
             self.connection.close()
             self.connection = None
 
-    def get_tables(self, table_names: Optional[List[str]] = None) -> List[TableInfo]:
+    def get_tables(self, table_names: Optional[Sequence[str]] = None) -> List[TableInfo]:
         if not self.connection:
             raise RuntimeError("Not connected to database")
 
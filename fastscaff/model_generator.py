@@ -337,7 +337,8 @@ def generate_models(
     for table in tables:
         content = generator.generate_single(table)
         file_path = output_path / f"{table.name}.py"
-        file_path.write_text(content, encoding="utf-8")
+        if not file_path.exists() or file_path.read_bytes() != content.encode("utf-8"):
+            file_path.write_text(content, encoding="utf-8")
         written.append(file_path)
     return written
 
@@ -1,15 +1,36 @@
 from typing import Any, Dict, Optional
 
 
+def _to_status_code(code: int) -> int:
+    if code < 1000:
+        return code
+    return code // 100
+
+
 class AppError(Exception):
     """Base application error with structured error code.
 
     Can be used directly (e.g. ``raise AppError(40001, "msg")``) or subclassed
     to define reusable error types that are safe under concurrency.
+
+    ``status_code`` is derived from ``code`` (e.g. 40001 -> 400) when the class
+    or instance is created, so ``code`` must not be changed after construction.
+    Subclasses may declare ``status_code`` to override the derived value.
     """
 
     code: int = 0
     message: str = ""
+    status_code: int = 0
+    _fixed_status_code: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Resolved once per error type; a status_code declared on a subclass
+        # is kept for it and its descendants.
+        if "status_code" in cls.__dict__:
+            cls._fixed_status_code = True
+        elif not cls._fixed_status_code:
+            cls.status_code = _to_status_code(cls.code)
 
     def __init__(
         self,
@@ -20,14 +41,10 @@ class AppError(Exception):
         self.code = code or self.__class__.code
         self.message = message or self.__class__.message
         self.details = details
+        if self.code != self.__class__.code and not self._fixed_status_code:
+            self.status_code = _to_status_code(self.code)
         super().__init__(self.message)
 
-    @property
-    def status_code(self) -> int:
-        if self.code < 1000:
-            return self.code
-        return self.code // 100
-
 
 # 400xx - Client errors
 class InvalidCredentialsError(AppError):
@@ -1,7 +1,7 @@
 from typing import List, Optional, Tuple
 
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
 from app.models.user import User
 from app.repositories.base import BaseRepository
@@ -23,6 +23,18 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalar_one_or_none()
 
+    async def get_by_username_or_email(
+        self,
+        username: str,
+        email: EmailStr,
+    ) -> Optional[User]:
+        result = await self.session.execute(
+            select(self.model)
+            .where(or_(self.model.username == username, self.model.email == email))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def get_users(
         self,
         username: Optional[str] = None,
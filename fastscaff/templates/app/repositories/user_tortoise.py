@@ -1,6 +1,7 @@
 from typing import List, Optional, Tuple
 
 from pydantic import EmailStr
+from tortoise.expressions import Q
 
 from app.models.user import User
 from app.repositories.base import BaseRepository
@@ -17,6 +18,13 @@ class UserRepository(BaseRepository[User]):
     async def get_by_email(self, email: EmailStr) -> Optional[User]:
         return await self.model.filter(email=email).first()
 
+    async def get_by_username_or_email(
+        self,
+        username: str,
+        email: EmailStr,
+    ) -> Optional[User]:
+        return await self.model.filter(Q(username=username) | Q(email=email)).first()
+
     async def get_users(
         self,
         username: Optional[str] = None,
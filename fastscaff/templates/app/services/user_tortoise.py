@@ -1,3 +1,5 @@
+import asyncio
+
 from app.core.security import get_password_hash
 from app.exceptions.base import UserAlreadyExistsError, UserNotFoundError
 from app.repositories.user import UserRepository
@@ -9,15 +11,11 @@ class UserService:
         self.repo = UserRepository()
 
     async def create_user(self, data: UserCreate) -> UserInfo:
-        existing = await self.repo.get_by_username(data.username)
-        if existing:
-            raise UserAlreadyExistsError()
-
-        existing = await self.repo.get_by_email(data.email)
+        existing = await self.repo.get_by_username_or_email(data.username, data.email)
         if existing:
             raise UserAlreadyExistsError()
 
-        hashed_password = get_password_hash(data.password)
+        hashed_password = await asyncio.to_thread(get_password_hash, data.password)
         user = await self.repo.create_user(
             username=data.username,
             email=data.email,